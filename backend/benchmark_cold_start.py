@@ -0,0 +1,173 @@
+"""
+Cold-start benchmark for the backend.
+
+Measures, in fresh interpreter processes:
+  - import time of each backend module (tools, node, graph, main)
+  - first-build time: building the team graphs right after importing main, i.e.
+    the LLM client and tool construction that lazy loading defers to the first request
+  - time-to-ready of a uvicorn worker: process spawn until /ready returns 200, both
+    with lazy loading (the default) and with EAGER_WARM_UP=1, which loads everything
+    before reporting ready, like the old eager imports did
+
+Usage:
+    python benchmark_cold_start.py [--runs 5] [--skip-server] [--timeout 120]
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent
+MODULES = ["tools", "node", "graph", "main"]
+
+STDERR_TAIL_LINES = 20
+
+_IMPORT_SNIPPET = (
+    "import time; _t = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - _t)"
+)
+_FIRST_BUILD_SNIPPET = (
+    "import time, main; _t = time.perf_counter(); main.build_team_graphs(None); "
+    "print(time.perf_counter() - _t)"
+)
+
+
+def _tail(text: str) -> str:
+    return "\n".join(text.strip().splitlines()[-STDERR_TAIL_LINES:])
+
+
+# Run a timing snippet in a fresh interpreter and return the seconds it prints.
+def _run_snippet(snippet: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", snippet],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Benchmark subprocess exited with code {result.returncode}:\n{_tail(result.stderr)}"
+        )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+# Import a single module in a fresh interpreter and return the elapsed seconds.
+def measure_import(module: str) -> float:
+    return _run_snippet(_IMPORT_SNIPPET.format(module=module))
+
+
+# Import main in a fresh interpreter and time building the team graphs.
+def measure_first_build() -> float:
+    return _run_snippet(_FIRST_BUILD_SNIPPET)
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# Return (status code, decoded JSON body or None) for a GET request.
+def _get_ready(url: str) -> tuple:
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            status, raw = response.status, response.read()
+    except urllib.error.HTTPError as e:
+        status, raw = e.code, e.read()
+    try:
+        body = json.loads(raw)
+    except ValueError:
+        body = None
+    return status, body
+
+
+# Start a uvicorn worker and return (seconds until listening, seconds until /ready is 200).
+def measure_time_to_ready(timeout: float, eager: bool = False) -> tuple:
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/ready"
+    env = dict(os.environ, EAGER_WARM_UP="1" if eager else "0")
+    # uvicorn logs to stderr; keep it in a file so failures can be diagnosed
+    stderr_file = tempfile.TemporaryFile(mode="w+")
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=stderr_file,
+    )
+    listening = None
+    try:
+        while time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                stderr_file.seek(0)
+                raise RuntimeError(
+                    f"uvicorn exited early with code {process.returncode}:\n{_tail(stderr_file.read())}"
+                )
+            try:
+                status, body = _get_ready(url)
+            except (urllib.error.URLError, ConnectionError, socket.timeout):
+                time.sleep(0.02)
+                continue
+            if listening is None:
+                listening = time.perf_counter() - start
+            if status == 200:
+                return listening, time.perf_counter() - start
+            error = body.get("error") if isinstance(body, dict) else None
+            if status == 500 or error:
+                raise RuntimeError(f"Server warm-up failed: {error or 'unknown error'}")
+            time.sleep(0.02)
+        raise TimeoutError(f"/ready did not return 200 within {timeout}s")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        stderr_file.close()
+
+
+def _summary(samples: list) -> dict:
+    return {
+        "median": round(statistics.median(samples), 4),
+        "min": round(min(samples), 4),
+        "max": round(max(samples), 4),
+        "runs": len(samples),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure backend import time and time-to-ready.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh processes per measurement")
+    parser.add_argument("--skip-server", action="store_true", help="Only measure module import time")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds to wait for /ready")
+    args = parser.parse_args()
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    results = {"import_seconds": {}}
+    for module in MODULES:
+        samples = [measure_import(module) for _ in range(args.runs)]
+        results["import_seconds"][module] = _summary(samples)
+
+    results["first_build_seconds"] = _summary([measure_first_build() for _ in range(args.runs)])
+
+    if not args.skip_server:
+        for mode, eager in (("lazy", False), ("eager", True)):
+            listening, ready = zip(*(measure_time_to_ready(args.timeout, eager) for _ in range(args.runs)))
+            results[f"time_to_listening_seconds_{mode}"] = _summary(list(listening))
+            results[f"time_to_ready_seconds_{mode}"] = _summary(list(ready))
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
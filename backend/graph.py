@@ -11,7 +11,6 @@ from node import make_doc_writing_node, make_note_taking_node, make_chart_genera
 from node import make_call_research_team, make_call_paper_writing_team
 import tools
 
-from langchain_community.tools.tavily_search import TavilySearchResults
 from typing import Callable, Any
 
 logger = logging.getLogger(__name__)
@@ -39,7 +38,7 @@ def build_super_team_graph(
 #Build the research team graph consisting of search and web scraper nodes.
 def build_research_team_graph(
     llm: BaseChatModel,
-    search_tool: TavilySearchResults,
+    search_tool: BaseTool = None,
     on_yield: Callable = None
 ) -> Any:
     research_supervisor_node = make_supervisor_node(llm, ["search", "web_scraper"], on_yield=on_yield, node_name="research_team")
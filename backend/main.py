@@ -1,9 +1,13 @@
+import time
+_MODULE_LOAD_START = time.perf_counter()  # taken before any imports, so cold-start import cost is included
+
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, Query, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
+from contextlib import asynccontextmanager
 from pathlib import Path
 from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
+from langchain_core.language_models.chat_models import BaseChatModel
 from dotenv import load_dotenv
 load_dotenv()  # Load environment variables from .env
 import tools
@@ -11,6 +15,7 @@ import os
 import logging
 import json
 import asyncio
+import threading
 
 from collector import AsyncYieldCollector
 from graph import build_research_team_graph, build_writing_team_graph, build_super_team_graph
@@ -26,14 +31,90 @@ WORKING_DIRECTORY = tools.WORKING_DIRECTORY
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-llm = ChatOpenAI(
-    model_name="gpt-4o-mini",
-    streaming=True,
-    openai_api_key=your_openai_api_key,
-    base_url="https://api.poixe.com/v1"
-)
+# Set EAGER_WARM_UP=1 on production workers to load the LLM client and every tool in
+# the background at startup; /ready then reports 503 until that finishes. By default
+# nothing heavy is loaded until the first request needs it, which keeps reloads fast.
+EAGER_WARM_UP = os.getenv("EAGER_WARM_UP", "").lower() in ("1", "true", "yes")
+WARM_UP_MAX_BACKOFF = 60.0
+
+# Readiness state. seconds_to_ready is measured from the start of this module's import.
+_readiness = {"ready": False, "error": None, "seconds_to_ready": None}
+
+_llm = None
+_LLM_LOCK = threading.Lock()
 
-app = FastAPI()
+
+def get_llm() -> BaseChatModel:
+    """
+    Build the shared LLM client on first use (importing langchain_openai is slow)
+    """
+    global _llm
+    if _llm is None:
+        with _LLM_LOCK:
+            if _llm is None:
+                from langchain_openai import ChatOpenAI
+
+                _llm = ChatOpenAI(
+                    model_name="gpt-4o-mini",
+                    streaming=True,
+                    openai_api_key=your_openai_api_key,
+                    base_url="https://api.poixe.com/v1"
+                )
+    return _llm
+
+
+def warm_up() -> None:
+    """
+    Construct the LLM client and all registered tools so the first request does not pay for it
+    """
+    get_llm()
+    tools.warm_up()
+
+
+def _mark_ready() -> None:
+    _readiness["ready"] = True
+    _readiness["error"] = None
+    _readiness["seconds_to_ready"] = round(time.perf_counter() - _MODULE_LOAD_START, 3)
+    logger.info(f"Ready {_readiness['seconds_to_ready']}s after module import")
+
+
+async def _warm_up_in_background() -> None:
+    # Retry with exponential backoff: a failed warm-up must not leave the worker unusable
+    delay = 1.0
+    while True:
+        try:
+            await asyncio.to_thread(warm_up)
+            _mark_ready()
+            return
+        except Exception as e:
+            logger.exception(f"Warm-up failed, retrying in {delay}s")
+            _readiness["error"] = str(e)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, WARM_UP_MAX_BACKOFF)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warm_up_task = None
+    if EAGER_WARM_UP:
+        # Warm up in the background so the server starts accepting connections immediately
+        warm_up_task = asyncio.create_task(_warm_up_in_background())
+    yield
+    if warm_up_task is not None:
+        warm_up_task.cancel()
+
+
+# Build the three team graphs. This constructs the LLM client and tools on first use,
+# so it is run in a worker thread to keep the event loop responsive.
+def build_team_graphs(on_yield) -> tuple:
+    llm = get_llm()
+    research_team = build_research_team_graph(llm, tools.get_tool("tavily_search"), on_yield=on_yield)
+    writing_team = build_writing_team_graph(llm, WORKING_DIRECTORY, on_yield=on_yield)
+    super_team = build_super_team_graph(llm, research_team, writing_team)
+    return research_team, writing_team, super_team
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -53,9 +134,9 @@ async def ws_stream(websocket: WebSocket):
         graph_name = data.get("graph", "supervisor")
 
         InnerMessageCollector = AsyncYieldCollector()
-        research_team = build_research_team_graph(llm, tools.tavily_tool, on_yield=InnerMessageCollector.on_yield)
-        writing_team = build_writing_team_graph(llm, WORKING_DIRECTORY, on_yield=InnerMessageCollector.on_yield)
-        super_team = build_super_team_graph(llm, research_team, writing_team)
+        research_team, writing_team, super_team = await asyncio.to_thread(
+            build_team_graphs, InnerMessageCollector.on_yield
+        )
 
         user_input = {"messages": [HumanMessage(content=query)]}
         logger.info(f"agent_stream: user_input={user_input}")
@@ -103,6 +184,27 @@ async def ws_stream(websocket: WebSocket):
         logger.exception("WebSocket stream error")
         await websocket.send_text(json.dumps({"event": "error", "msg": str(e)}))
 
+@app.get("/ready")
+async def ready() -> JSONResponse:
+    """
+    Readiness probe. Without EAGER_WARM_UP the app is ready once it is imported and
+    configured. With it: 503 while warming up, 200 once the LLM client and tools are
+    loaded, 500 while the last warm-up attempt failed (error in the body; it is retried)
+    """
+    content = {
+        "ready": _readiness["ready"],
+        "seconds_to_ready": _readiness["seconds_to_ready"],
+        "loaded_tools": tools.loaded_tools(),
+        "error": _readiness["error"],
+    }
+    if _readiness["ready"]:
+        status_code = 200
+    elif _readiness["error"] is not None:
+        status_code = 500
+    else:
+        status_code = 503
+    return JSONResponse(content=content, status_code=status_code)
+
 @app.get("/files")
 async def list_files() -> JSONResponse:
     """
@@ -135,6 +237,9 @@ async def download_file(file_name: str) -> FileResponse:
         media_type="application/octet-stream"
     )
 
+if not EAGER_WARM_UP:
+    _mark_ready()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -7,7 +7,7 @@ from langgraph.graph import MessagesState, END
 from langgraph.types import Command
 from langchain_core.messages import HumanMessage
 from langgraph.prebuilt import create_react_agent
-from langchain_community.tools.tavily_search import TavilySearchResults
+from langchain_core.tools import BaseTool
 import tools
 
 # Get a logger for this module
@@ -60,11 +60,11 @@ def make_supervisor_node(
 # Node for search agent
 def make_search_node(
     llm: BaseChatModel, 
-    tavily_tool: TavilySearchResults, 
+    tavily_tool: BaseTool = None, 
     goto: str = 'supervisor', 
     on_yield=None
 ) -> callable:
-    search_agent = create_react_agent(llm, tools=[tools.tavily_tool])
+    search_agent = create_react_agent(llm, tools=[tavily_tool or tools.get_tool("tavily_search")])
 
     async def search_node(state: State) -> Command:
         logger.info(f"search_node called, state: {state}")
@@ -88,7 +88,7 @@ def make_web_scraper_node(
     goto: str = "supervisor", 
     on_yield=None
 ) -> callable:
-    web_scraper_agent = create_react_agent(llm, tools=[tools.scrape_webpages])
+    web_scraper_agent = create_react_agent(llm, tools=tools.get_tools(["scrape_webpages"]))
 
     async def web_scraper_node(state: State) -> Command:
         logger.info(f"web_scraper_node called, state: {state}")
@@ -114,7 +114,7 @@ def make_doc_writing_node(
     node_name="doc_writer"
 ) -> callable:
     doc_writer_agent = create_react_agent(llm,
-        tools=[tools.write_document, tools.edit_document, tools.read_document],
+        tools=tools.get_tools(["write_document", "edit_document", "read_document"]),
         prompt=(
             "You can read, write and edit documents based on note-taker's outlines. "
             "Don't ask follow-up questions."
@@ -148,7 +148,7 @@ def make_note_taking_node(
 ) -> callable:
     note_taking_agent = create_react_agent(
         llm,
-        tools=[tools.create_outline, tools.read_document],
+        tools=tools.get_tools(["create_outline", "read_document"]),
         prompt=(
             "You can read documents and create outlines for the document writer. "
             "Don't ask follow-up questions."
@@ -181,7 +181,7 @@ def make_chart_generating_node(
     node_name="chart_generator"
 ) -> callable:
     chart_generating_agent = create_react_agent(
-        llm, tools=[tools.read_document, tools.python_repl_tool]
+        llm, tools=tools.get_tools(["read_document", "python_repl_tool"])
     )
 
     async def chart_generating_node(state: State) -> Command[Literal["supervisor"]]:
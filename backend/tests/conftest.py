@@ -0,0 +1,10 @@
+import os
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# The backend modules import each other as top-level modules (e.g. `import tools`)
+sys.path.insert(0, str(BACKEND_DIR))
+# main refuses to import without an API key; no request reaches the API in these tests
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture
+def readiness(monkeypatch):
+    state = {"ready": False, "error": None, "seconds_to_ready": None}
+    monkeypatch.setattr(main, "_readiness", state)
+    return state
+
+
+@pytest.fixture
+def client():
+    # No `with` block: lifespan (and so eager warm-up) does not run
+    return TestClient(main.app)
+
+
+def test_ready_returns_503_while_warming_up(readiness, client):
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+
+def test_ready_returns_200_once_ready(readiness, client):
+    readiness.update(ready=True, seconds_to_ready=0.5)
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["seconds_to_ready"] == 0.5
+
+
+def test_ready_returns_500_with_error_after_failed_warm_up(readiness, client):
+    readiness["error"] = "TAVILY_API_KEY is not set"
+    response = client.get("/ready")
+    assert response.status_code == 500
+    assert response.json()["error"] == "TAVILY_API_KEY is not set"
+
+
+def test_warm_up_is_retried_until_it_succeeds(readiness, monkeypatch):
+    attempts = []
+
+    def flaky_warm_up():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError("transient")
+
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(main, "warm_up", flaky_warm_up)
+    monkeypatch.setattr(main.asyncio, "sleep", no_sleep)
+    asyncio.run(main._warm_up_in_background())
+
+    assert len(attempts) == 3
+    assert readiness["ready"] is True
+    assert readiness["error"] is None
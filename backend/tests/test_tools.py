@@ -0,0 +1,78 @@
+import subprocess
+import sys
+
+import pytest
+
+from conftest import BACKEND_DIR
+import tools
+
+HEAVY_MODULES = ["langchain_tavily", "langchain_experimental", "langchain_community", "bs4"]
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    # Isolate each test from tools registered or built by other tests
+    monkeypatch.setattr(tools, "_TOOL_FACTORIES", dict(tools._TOOL_FACTORIES))
+    monkeypatch.setattr(tools, "_TOOL_INSTANCES", {})
+    return tools
+
+
+def test_import_does_not_load_heavy_dependencies():
+    # Run in a fresh interpreter: other tests may already have imported these modules
+    code = (
+        "import sys, tools; "
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_get_tool_builds_each_tool_once(registry):
+    calls = []
+
+    @registry.register_tool("counting_tool")
+    def _make_counting_tool():
+        calls.append(1)
+        return registry.read_document
+
+    assert "counting_tool" not in registry.loaded_tools()
+    first = registry.get_tool("counting_tool")
+    second = registry.get_tool("counting_tool")
+    assert first is second is registry.read_document
+    assert len(calls) == 1
+    assert "counting_tool" in registry.loaded_tools()
+
+
+def test_get_tool_unknown_name_raises_key_error(registry):
+    with pytest.raises(KeyError, match="no_such_tool"):
+        registry.get_tool("no_such_tool")
+
+
+def test_factory_can_build_on_another_tool(registry):
+    @registry.register_tool("derived_tool")
+    def _make_derived_tool():
+        return registry.get_tool("read_document")
+
+    assert registry.get_tool("derived_tool") is registry.read_document
+
+
+def test_get_tools_preserves_order(registry):
+    names = ["write_document", "create_outline", "read_document"]
+    assert [t.name for t in registry.get_tools(names)] == names
+
+
+def test_failed_factory_is_retried(registry):
+    attempts = []
+
+    @registry.register_tool("flaky_tool")
+    def _make_flaky_tool():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("transient")
+        return registry.read_document
+
+    with pytest.raises(RuntimeError, match="transient"):
+        registry.get_tool("flaky_tool")
+    assert registry.get_tool("flaky_tool") is registry.read_document
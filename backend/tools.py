@@ -1,22 +1,77 @@
-from typing import Annotated, List
-from langchain_community.document_loaders import WebBaseLoader
-from langchain_tavily import TavilySearch
-from langchain_core.tools import tool
+import threading
+from typing import Annotated, Callable, List
+from langchain_core.tools import BaseTool, tool
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Dict, Optional
-from langchain_experimental.utilities import PythonREPL
 from typing_extensions import TypedDict
 
 
-tavily_tool = TavilySearch(max_results=5)
-    
 _TEMP_DIRECTORY = TemporaryDirectory()
 WORKING_DIRECTORY = Path(_TEMP_DIRECTORY.name)
 
+# Lazy tool registry: tool name -> factory. Factories are only called (and their
+# heavy dependencies only imported) the first time a tool is requested.
+_TOOL_FACTORIES: Dict[str, Callable[[], BaseTool]] = {}
+_TOOL_INSTANCES: Dict[str, BaseTool] = {}
+# Reentrant so a factory may build on another registered tool via get_tool().
+_TOOL_LOCK = threading.RLock()
+
+
+def register_tool(name: str) -> Callable:
+    """Register a factory that builds the tool called `name` on first use."""
+    def decorator(factory: Callable[[], BaseTool]) -> Callable[[], BaseTool]:
+        _TOOL_FACTORIES[name] = factory
+        return factory
+    return decorator
+
+
+def get_tool(name: str) -> BaseTool:
+    """Return the tool called `name`, constructing it on first use."""
+    instance = _TOOL_INSTANCES.get(name)
+    if instance is not None:
+        return instance
+    if name not in _TOOL_FACTORIES:
+        raise KeyError(f"Unknown tool '{name}'. Available tools: {sorted(_TOOL_FACTORIES)}")
+    with _TOOL_LOCK:
+        if name not in _TOOL_INSTANCES:
+            _TOOL_INSTANCES[name] = _TOOL_FACTORIES[name]()
+        return _TOOL_INSTANCES[name]
+
+
+def get_tools(names: List[str]) -> List[BaseTool]:
+    """Return the tools called `names`, in order, constructing them on first use."""
+    return [get_tool(name) for name in names]
+
+
+def available_tools() -> List[str]:
+    """Names of all registered tools."""
+    return sorted(_TOOL_FACTORIES)
+
+
+def loaded_tools() -> List[str]:
+    """Names of tools that have already been constructed."""
+    return sorted(_TOOL_INSTANCES)
+
+
+def warm_up(names: Optional[List[str]] = None) -> List[str]:
+    """Construct the given tools (all registered tools by default) ahead of first use."""
+    get_tools(names if names is not None else available_tools())
+    return loaded_tools()
+
+
+@register_tool("tavily_search")
+def _make_tavily_tool() -> BaseTool:
+    from langchain_tavily import TavilySearch
+
+    return TavilySearch(max_results=5)
+
+
 @tool
 def scrape_webpages(urls: List[str]) -> str:
     """Use requests and bs4 to scrape the provided web pages for detailed information."""
+    from langchain_community.document_loaders import WebBaseLoader
+
     loader = WebBaseLoader(urls)
     docs = loader.load()
     return "\n\n".join(
@@ -116,7 +171,19 @@ def edit_document(
 
 # Warning: This executes code locally, which can be unsafe when not sandboxed
 
-repl = PythonREPL()
+_repl = None
+_REPL_LOCK = threading.Lock()
+
+
+def _get_repl():
+    global _repl
+    if _repl is None:
+        with _REPL_LOCK:
+            if _repl is None:
+                from langchain_experimental.utilities import PythonREPL
+
+                _repl = PythonREPL()
+    return _repl
 
 
 @tool
@@ -126,7 +193,34 @@ def python_repl_tool(
     """Use this to execute python code. If you want to see the output of a value,
     you should print it out with `print(...)`. This is visible to the user."""
     try:
-        result = repl.run(code)
+        result = _get_repl().run(code)
     except BaseException as e:
         return f"Failed to execute. Error: {repr(e)}"
-    return f"Successfully executed:\n```python\n{code}\n```\nStdout: {result}"
\ No newline at end of file
+    return f"Successfully executed:\n```python\n{code}\n```\nStdout: {result}"
+
+
+@register_tool("scrape_webpages")
+def _make_scrape_webpages_tool() -> BaseTool:
+    # Import the loader and bs4 (only imported by the loader when it scrapes) up front,
+    # so the first scrape does not pay for them
+    import bs4  # noqa: F401
+    from langchain_community.document_loaders import WebBaseLoader  # noqa: F401
+
+    return scrape_webpages
+
+
+@register_tool("python_repl_tool")
+def _make_python_repl_tool() -> BaseTool:
+    _get_repl()
+    return python_repl_tool
+
+
+# The file tools have no heavy dependencies, so they are registered as
+# already-built instances.
+for _local_tool in (
+    create_outline,
+    read_document,
+    write_document,
+    edit_document,
+):
+    register_tool(_local_tool.name)(lambda t=_local_tool: t)